@@ -2,11 +2,4 @@ from django.apps import AppConfig
 
 class FamilyTreeConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'project'
-
-
-from django.contrib import admin
-# from .models import Member
-
-# admin.site.register(Member)
-
+    name = 'family_tree_app'
@@ -3,19 +3,20 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Count, Q
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
 from django.urls import reverse
+from functools import lru_cache
 from itertools import chain
-from opencage.geocoder import OpenCageGeocode
 from operator import attrgetter
 # from people.relations import closest_common_ancestor, describe_relative
-from taggit.managers import TaggableManager
-from taggit.models import Tag, TaggedItem
-from tinymce.models import HTMLField
 import os
-# import settings
-from django.db import models
+
+GENDER_CHOICES = (('M', 'Male'),
+                  ('F', 'Female'),
+                  ('T', 'Transgender'),
+                  ('N', 'Non-binary'),
+                  ('P', 'Prefers not to respond'))
 
 
 class Country(models.Model):
@@ -28,11 +29,25 @@ class Country(models.Model):
     def __str__(self):
         return self.name
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def all_cached(cls):
+        """
+        Return every country, ordered by name, from a process-level cache.
+        """
+        return tuple(cls.objects.order_by('name'))
+
     class Meta:
         ordering = ['name']
         verbose_name_plural = 'countries'
 
 
+@receiver(post_save, sender=Country)
+@receiver(post_delete, sender=Country)
+def clear_country_cache(sender, **kwargs):
+    Country.all_cached.cache_clear()
+
+
 class Location(models.Model):
     pass
 
@@ -57,16 +72,18 @@ class Person(models.Model):
                                 max_length=20,
                                 help_text='nickname')
     gender = models.CharField(max_length=1,
-                              choices=(('M', 'Male'),
-                                       ('F', 'Female'),
-                                       ('T', 'Transgender'),
-                                       ('N', 'Non-binary'),
-                                       ('P', 'Prefers not to respond')),
+                              choices=GENDER_CHOICES,
                               blank=False,
-                              default=None)
+                              default='P')
 
 
     id = models.AutoField(primary_key=True)
 
     def __str__(self):
-        return self.text
\ No newline at end of file
+        return f'{self.first_name} {self.last_name}'
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['last_name', 'first_name'], name='person_name_idx'),
+            models.Index(fields=['gender'], name='person_gender_idx'),
+        ]
\ No newline at end of file
@@ -14,6 +14,10 @@ class UserCacheMixin:
     user_cache = None
 
 
+class ActivationCacheMixin:
+    activation_cache = None
+
+
 class SignIn(UserCacheMixin, forms.Form):
     password = forms.CharField(label=_('Password'), strip=False, widget=forms.PasswordInput)
 
@@ -128,7 +132,7 @@ class SignUpForm(UserCreationForm):
         return email
 
 
-class ResendActivationCodeForm(UserCacheMixin, forms.Form):
+class ResendActivationCodeForm(UserCacheMixin, ActivationCacheMixin, forms.Form):
     email_or_username = forms.CharField(label=_('Email or Username'))
 
     def clean_email_or_username(self):
@@ -150,11 +154,12 @@ class ResendActivationCodeForm(UserCacheMixin, forms.Form):
             raise ValidationError(_('Activation code has already been sent. You can request a new code in 24 hours.'))
 
         self.user_cache = user
+        self.activation_cache = activation
 
         return email_or_username
 
 
-class ResendActivationCodeViaEmailForm(UserCacheMixin, forms.Form):
+class ResendActivationCodeViaEmailForm(UserCacheMixin, ActivationCacheMixin, forms.Form):
     email = forms.EmailField(label=_('Email'))
 
     def clean_email(self):
@@ -176,6 +181,7 @@ class ResendActivationCodeViaEmailForm(UserCacheMixin, forms.Form):
             raise ValidationError(_('Activation code has already been sent. You can request a new code in 24 hours.'))
 
         self.user_cache = user
+        self.activation_cache = activation
 
         return email
 
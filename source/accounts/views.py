@@ -108,7 +108,7 @@ class SignUpView(GuestOnlyView, FormView):
         # Change the username to the "user_ID" form
         if settings.DISABLE_USERNAME:
             user.username = f'user_{user.id}'
-            user.save()
+            user.save(update_fields=['username'])
 
         if settings.ENABLE_USER_ACTIVATION:
             code = get_random_string(20)
@@ -136,12 +136,12 @@ class SignUpView(GuestOnlyView, FormView):
 class ActivateView(View):
     @staticmethod
     def get(request, code):
-        act = get_object_or_404(Activation, code=code)
+        act = get_object_or_404(Activation.objects.select_related('user'), code=code)
 
         # Activate profile
         user = act.user
         user.is_active = True
-        user.save()
+        user.save(update_fields=['is_active'])
 
         # Remove the activation record
         act.delete()
@@ -164,8 +164,7 @@ class ResendActivationCodeView(GuestOnlyView, FormView):
     def form_valid(self, form):
         user = form.user_cache
 
-        activation = user.activation_set.first()
-        activation.delete()
+        form.activation_cache.delete()
 
         code = get_random_string(20)
 
@@ -219,7 +218,7 @@ class ChangeProfileView(LoginRequiredMixin, FormView):
         user = self.request.user
         user.first_name = form.cleaned_data['first_name']
         user.last_name = form.cleaned_data['last_name']
-        user.save()
+        user.save(update_fields=['first_name', 'last_name'])
 
         messages.success(self.request, _('Profile data has been successfully updated.'))
 
@@ -258,7 +257,7 @@ class ChangeEmailView(LoginRequiredMixin, FormView):
             messages.success(self.request, _('To complete the change of email address, click on the link sent to it.'))
         else:
             user.email = email
-            user.save()
+            user.save(update_fields=['email'])
 
             messages.success(self.request, _('Email successfully changed.'))
 
@@ -268,12 +267,12 @@ class ChangeEmailView(LoginRequiredMixin, FormView):
 class ChangeEmailActivateView(View):
     @staticmethod
     def get(request, code):
-        act = get_object_or_404(Activation, code=code)
+        act = get_object_or_404(Activation.objects.select_related('user'), code=code)
 
         # Change the email
         user = act.user
         user.email = act.email
-        user.save()
+        user.save(update_fields=['email'])
 
         # Remove the activation record
         act.delete()